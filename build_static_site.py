@@ -0,0 +1,1300 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from html import escape
+from urllib.parse import quote
+
+# --- Configuration ---
+CASES_JS = "cipas_full_data.js"
+MEETINGS_JSON = "meetings_data.json"
+OUTPUT_DIR = "site"
+MANIFEST_NAME = "build_manifest.json"
+# 標記由本工具產生的頁面，清理時只會刪除帶有此標記或記錄在 manifest 中的檔案
+GENERATED_MARKER = "<!-- generated by build_static_site.py -->"
+
+# 樣式直接取自現有看板，確保靜態頁與互動版外觀一致
+DASHBOARD_HTML = "dashboard.html"
+STATS_HTML = "stats.html"
+MEETINGS_HTML = "meetings_dashboard.html"
+
+CDN_HEAD = """    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.0/font/bootstrap-icons.css">"""
+BOOTSTRAP_JS = '<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>'
+
+# --- 與 dashboard.html 相同的組織與案件分類規則 ---
+OFFICIAL_ORGS = [
+    '中國國民黨', '中華民國婦女聯合會', '中國廣播股份有限公司',
+    '中央投資股份有限公司', '欣裕台股份有限公司', '中影股份有限公司',
+    '社團法人中國青年救國團', '中華救助總會', '財團法人民生建設基金會',
+    '財團法人民族基金會', '財團法人民權基金會', '財團法人國家發展基金會',
+    '欣光華股份有限公司', '光華投資股份有限公司'
+]
+
+NAME_NORMALIZATION = {
+    '婦聯會': '中華民國婦女聯合會',
+    '中華民國婦女聯合會': '中華民國婦女聯合會',
+    '中廣': '中國廣播股份有限公司',
+    '中國廣播公司': '中國廣播股份有限公司',
+    '中國廣播股份有限公司': '中國廣播股份有限公司',
+    '中投': '中央投資股份有限公司',
+    '中央投資公司': '中央投資股份有限公司',
+    '中央投資股份有限公司': '中央投資股份有限公司',
+    '欣裕台': '欣裕台股份有限公司',
+    '欣裕台公司': '欣裕台股份有限公司',
+    '欣裕台股份有限公司': '欣裕台股份有限公司',
+    '光華投資': '光華投資股份有限公司',
+    '光華投資公司': '光華投資股份有限公司',
+    '光華投資股份有限公司': '光華投資股份有限公司',
+    '國民黨': '中國國民黨',
+    '中國國民黨': '中國國民黨',
+    '救總': '中華救助總會',
+    '中華救助總會': '中華救助總會',
+    '救助總會': '中華救助總會'
+}
+
+MATTER_ORDER = [
+    '核心案件：附隨組織地位認定',
+    '財產處分：不當取得財產移轉與追徵',
+    '特定財產案：美齡樓',
+    '特定財產案：大孝大樓',
+    '特定財產案：國發院土地',
+    '特定財產案：台中市黨部',
+    '裁罰案件：違反黨產條例',
+    '其他程序案件'
+]
+
+PLAINTIFF_KEYWORDS = [
+    ('光華投資', '光華投資股份有限公司'), ('中廣', '中國廣播股份有限公司'),
+    ('中投', '中央投資股份有限公司'), ('欣裕台', '欣裕台股份有限公司'), ('國民黨', '中國國民黨')
+]
+
+# --- 與 meetings_dashboard.html 相同的會議解析規則 ---
+KEY_ORGS = [
+    {'name': '中國廣播', 'keywords': ['中廣', '中國廣播']},
+    {'name': '中國青年救國團', 'keywords': ['救國團', '青年救國團']},
+    {'name': '中央投資', 'keywords': ['中投', '中央投資']},
+    {'name': '欣裕台', 'keywords': ['欣裕台']},
+    {'name': '中華救助總會', 'keywords': ['救助總會', '救總', '中華救助']},
+    {'name': '婦聯會', 'keywords': ['婦聯會', '婦女聯合會']}
+]
+
+ISSUE_STATUS = {
+    'agreed': ('同意', 'status-agreed', 'bi-check-circle-fill'),
+    'partial': ('部分核定', 'status-partial', 'bi-exclamation-triangle-fill'),
+    'rejected': ('否准/駁回', 'status-rejected', 'bi-x-circle-fill'),
+    'noted': ('洽悉', 'status-noted', 'bi-info-circle'),
+    'pending': ('處理中/保留', 'status-pending', 'bi-hourglass-split')
+}
+
+MONEY_PATTERN = re.compile(r'([0-9,]+[億萬]?[0-9,]*[億萬]?[0-9,]*|[0-9,]+)元')
+ADMIN_ACTION_PATTERN = re.compile(r'黨產處字第(\d+)號')
+
+
+# --- 資料載入 ---
+def load_js_array(path):
+    """讀取爬蟲輸出的 `const xxx = [...];` 檔案。"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return json.loads(content[content.index('['):content.rindex(']') + 1])
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def extract_style(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        match = re.search(r'<style>(.*?)</style>', f.read(), re.S)
+    return match.group(1) if match else ""
+
+
+STYLE_SOURCES = {'dashboard': DASHBOARD_HTML, 'stats': STATS_HTML, 'meetings': MEETINGS_HTML}
+# 由 build_site() 載入，避免 import 時即依工作目錄讀檔
+STYLES = {}
+
+
+def load_styles():
+    missing = [path for path in STYLE_SOURCES.values() if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"找不到樣式來源檔案: {', '.join(missing)} (請於專案根目錄執行)")
+    return {key: extract_style(path) for key, path in STYLE_SOURCES.items()}
+
+
+def parse_date(text):
+    try:
+        return datetime.strptime(text, '%Y/%m/%d')
+    except (TypeError, ValueError):
+        return None
+
+
+def date_key(event):
+    return parse_date(event['date']) or datetime.min
+
+
+def round_half_up(value):
+    # 與 JS 的 Math.round 一致，避免靜態頁與互動版數字不同
+    return int(value + 0.5)
+
+
+def unique(values):
+    return list(dict.fromkeys(values))
+
+
+# --- 案件分析 (移植自 dashboard.html) ---
+def get_matter_category(title):
+    if '美齡樓' in title: return '特定財產案：美齡樓'
+    if '大孝大樓' in title: return '特定財產案：大孝大樓'
+    if '國發院' in title: return '特定財產案：國發院土地'
+    if '台中市黨部' in title: return '特定財產案：台中市黨部'
+    if '罰鍰' in title: return '裁罰案件：違反黨產條例'
+    if ('附隨組織' in title or any(title in (org + '案', org + '調查案') for org in OFFICIAL_ORGS)
+            or ('中央投資' in title and '欣裕台' in title and '股權' not in title)):
+        return '核心案件：附隨組織地位認定'
+    if '移轉國有' in title or '不當取得財產' in title or '追徵' in title or '股權' in title:
+        return '財產處分：不當取得財產移轉與追徵'
+    return '其他程序案件'
+
+
+def analyze_litigation_status(events):
+    if not events:
+        return {'label': '無進度', 'class': 'bg-secondary text-white', 'score': 0}
+    latest = sorted(events, key=date_key, reverse=True)[0]
+    latest_full = latest['caption'] + latest.get('description', '')
+    if '最高行政法院' in latest_full:
+        if '駁回' in latest_full or '確定' in latest_full:
+            return {'label': '處分獲永久維持 (定讞)', 'class': 'bg-success text-white', 'score': 100}
+        if '撤銷原處分' in latest_full:
+            return {'label': '處分遭永久撤銷 (定讞)', 'class': 'bg-danger text-white', 'score': -100}
+        if '發回' in latest_full or '更審' in latest_full:
+            return {'label': '法院發回更審', 'class': 'bg-warning text-dark', 'score': 50}
+    if '提起上訴' in latest['caption'] and '駁回' not in latest['caption']:
+        return {'label': '上訴審理中', 'class': 'bg-primary text-white', 'score': 40}
+    if '原告之訴駁回' in latest_full:
+        return {'label': '處分獲司法維持 (一審)', 'class': 'bg-success text-white', 'score': 80}
+    if '原處分撤銷' in latest_full:
+        return {'label': '處分遭司法撤銷 (一審)', 'class': 'bg-danger text-white', 'score': -80}
+    return {'label': '司法審理中', 'class': 'bg-primary text-white', 'score': 30}
+
+
+def analyze_item(item):
+    status = {'label': '處理中', 'class': 'bg-secondary text-white', 'score': 0}
+    if item['category_key'] == 'litigations':
+        lit_status = analyze_litigation_status(item['events'])
+        if lit_status['score'] >= 80:
+            status = {'label': '處分獲維持', 'class': 'bg-success text-white', 'score': 1}
+        elif lit_status['score'] < 0:
+            status = {'label': '效力受挫', 'class': 'bg-danger text-white', 'score': -1}
+        else:
+            status = {'label': '司法攻防中', 'class': 'bg-primary text-white', 'score': 0}
+    elif item['category_key'] == 'administrative_actions':
+        status = {'label': '處分已作成', 'class': 'bg-danger text-white', 'score': 1}
+    events = [{'date': e['date'], 'caption': e['caption'], 'description': e.get('description', '')}
+              for e in item['events']]
+    return {**item, 'events': events, 'displayStatus': status, 'matter': get_matter_category(item['title'])}
+
+
+def build_org_map(cases):
+    org_map = {}
+    for item in cases:
+        targets = [NAME_NORMALIZATION.get(a['org_full'], a['org_full']) for a in item['analysis']]
+        title = item['title']
+        if '美齡樓' in title: targets.append('中華民國婦女聯合會')
+        if '大孝大樓' in title or '國發院' in title or '台中市黨部' in title: targets.append('中國國民黨')
+        if '中廣' in title: targets.append('中國廣播股份有限公司')
+        for org in unique(targets):
+            if org in OFFICIAL_ORGS:
+                org_cases = org_map.setdefault(org, [])
+                if not any(c['id'] == item['id'] for c in org_cases):
+                    org_cases.append(item)
+    return org_map
+
+
+def find_admin_links(item, cases):
+    """回傳事件文字中引用到的處分字號 -> 對應行政處分案件 id。"""
+    links = {}
+    for e in item['events']:
+        for no in ADMIN_ACTION_PATTERN.findall(e['caption'] + ' ' + e['description']):
+            target = next((c for c in cases
+                           if c['category_key'] == 'administrative_actions' and no in c['title']), None)
+            if target:
+                links[no] = target['id']
+    return links
+
+
+def group_litigation_events(events, protagonists):
+    groups = {'處分基礎與共同事件': []}
+    for e in events:
+        content = e['caption'] + e['description']
+        if '作成' in e['caption'] or '釋字' in e['caption'] or '委員會議' in e['caption']:
+            groups['處分基礎與共同事件'].append(e)
+            continue
+        matches = []
+        for key, label in PLAINTIFF_KEYWORDS:
+            if key in content: matches.append(NAME_NORMALIZATION.get(label, label))
+        for p in protagonists:
+            if p in content: matches.append(NAME_NORMALIZATION.get(p, p))
+        if matches:
+            for p in unique(matches):
+                groups.setdefault(f'原告：{p}', []).append(e)
+        else:
+            groups['處分基礎與共同事件'].append(e)
+    return groups
+
+
+# --- 會議解析 (移植自 meetings_dashboard.html) ---
+def parse_people(raw):
+    if not raw:
+        return []
+    people = []
+    for part in re.split(r'[、，；\s]+', re.sub(r'等$', '', raw)):
+        if len(part) <= 1:
+            continue
+        clean_name = re.sub(r'[（(]請假[）)]', '', part).strip()
+        m = re.match(r'^(.+?委員|主任委員|副主任委員|主任秘書|組長|調查員)(.+)$', clean_name)
+        if m:
+            person = {'title': m.group(1), 'name': m.group(2)}
+        elif len(clean_name) > 3 and ('委員' in clean_name or '主任' in clean_name):
+            if '委員' in clean_name:
+                idx = clean_name.index('委員') + 2
+            else:
+                idx = clean_name.index('主任') + 2
+            person = {'title': clean_name[:idx], 'name': clean_name[idx:]}
+        else:
+            person = {'title': '委員', 'name': clean_name}
+        if person['name']:
+            people.append(person)
+    return people
+
+
+def extract_money(text):
+    return MONEY_PATTERN.findall(text)
+
+
+def analyze_status(text):
+    has_agree = '同意' in text or '許可' in text
+    has_deny = '否准' in text or '不同意' in text or '不予' in text or '駁回' in text
+    has_noted = '洽悉' in text
+    if has_agree and has_deny: return 'partial'
+    if has_deny: return 'rejected'
+    if has_agree: return 'agreed'
+    if has_noted: return 'noted'
+    return 'pending'
+
+
+def deep_parse_meeting(item):
+    text = (item.get('content_text') or "").replace('\\n', '\n')
+    lines = [l.strip() for l in text.split('\n') if l.strip()]
+    res = {
+        'id': str(item['id']), 'title': item['title'], 'date': item['date'],
+        'time': "", 'location': "", 'chairman': {}, 'members': [], 'staff': [], 'issues': []
+    }
+    current_section = ""
+    current_item = None
+    capturing_decision = False
+
+    for line in lines:
+        if '壹、時間：' in line: res['time'] = line.split('：')[1]
+        if '貳、地點：' in line: res['location'] = line.split('：')[1]
+        if '參、主席：' in line:
+            chair_raw = line.split('：')[1]
+            chair = parse_people(chair_raw)
+            res['chairman'] = chair[0] if chair else {'name': chair_raw, 'title': '主席'}
+        if re.match(r'^肆、出席(?:人員|委員)：', line):
+            res['members'] = parse_people(re.sub(r'^肆、出席(?:人員|委員)：', '', line))
+        if re.match(r'^列席(?:單位|人員)：', line):
+            res['staff'] = [s.strip() for s in re.split(r'[、，；]+', re.sub(r'^列席(?:單位|人員)：', '', line))]
+
+        if re.match(r'^柒、報告事項', line):
+            current_section = "報告"
+            continue
+        if re.match(r'^捌、討論事項', line):
+            current_section = "討論"
+            continue
+
+        item_match = re.match(r'^([一二三四五六七八九十]+)、(.+)', line)
+        if item_match and current_section:
+            if current_item: res['issues'].append(current_item)
+            current_item = {
+                'section': current_section, 'no': item_match.group(1), 'title': item_match.group(2),
+                'decision': "", 'desc': [], 'status': 'pending', 'money': extract_money(item_match.group(2))
+            }
+            capturing_decision = False
+        elif current_item:
+            if re.match(r'^(決定|決議)[:：]', line):
+                current_item['decision'] = line
+                capturing_decision = True
+            elif capturing_decision:
+                current_item['decision'] += " " + line
+                current_item['status'] = analyze_status(current_item['decision'])
+                current_item['money'] = unique(current_item['money'] + extract_money(line))
+            elif not re.match(r'^[壹貳參肆伍陸柒捌玖拾]、', line):
+                current_item['desc'].append(line)
+                current_item['money'] = unique(current_item['money'] + extract_money(line))
+    if current_item: res['issues'].append(current_item)
+    return res
+
+
+def build_member_stats(parsed_meetings):
+    stats = {}
+    for m in parsed_meetings:
+        for mem in m['members']:
+            entry = stats.setdefault(mem['name'], {'name': mem['name'], 'title': mem['title'], 'meetings': []})
+            if not any(mt['id'] == m['id'] for mt in entry['meetings']):
+                entry['meetings'].append({'id': m['id'], 'title': m['title'], 'date': m['date']})
+    return stats
+
+
+def find_related_meetings(issue, current_id, meetings):
+    clean_title = re.sub(r'[0-9]{2,3}年[0-9]{1,2}月[份]?', '', issue['title'])[:10]
+    history = [{'id': str(d['id']), 'date': d['date'], 'title': d['title']}
+               for d in meetings if str(d['id']) != current_id and clean_title in d['title']][:5]
+    return {'clean_title': clean_title, 'history': history}
+
+
+# --- 共用版型 ---
+def page_shell(title, style, body, scripts=""):
+    return f"""<!DOCTYPE html>
+{GENERATED_MARKER}
+<html lang="zh-Hant">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{escape(title)}</title>
+{CDN_HEAD}
+    <style>{style}</style>
+</head>
+<body>
+{body}
+{scripts}
+</body>
+</html>
+"""
+
+
+# 靜態頁僅保留互動所需的 JS：側欄開關、搜尋與清單過濾
+DASHBOARD_SCRIPT = """<script>
+    function toggleSidebar() { document.getElementById('sidebar').classList.toggle('active'); }
+    function handleSearch(e) {
+        if (e.key === 'Enter') {
+            const query = e.target.value.trim();
+            if (query) location.href = SITE_ROOT + 'cases/index.html?q=' + encodeURIComponent(query);
+        }
+    }
+</script>"""
+
+FILTER_SCRIPT = """<script>
+    (function () {
+        const query = new URLSearchParams(location.search).get('q') || '';
+        const input = document.getElementById('list-filter');
+        function applyFilter(q) {
+            let shown = 0;
+            document.querySelectorAll('[data-search]').forEach(el => {
+                const match = el.dataset.search.includes(q);
+                el.style.display = match ? '' : 'none';
+                if (match) shown++;
+            });
+            document.getElementById('result-count').textContent = shown;
+        }
+        if (input) {
+            input.value = query;
+            input.addEventListener('input', () => applyFilter(input.value.trim()));
+        }
+        applyFilter(query);
+    })();
+</script>"""
+
+STATS_SCRIPT = """<script>
+    // 與 stats.html 的 render() 相同：搜尋過濾案件後重算 KPI、日曆與阻塞分析，時間過濾只作用於日誌與勝訴數
+    let currentYear = null;
+    let currentMonth = null;
+
+    function selectMonth(y, m) {
+        if (currentYear === y && currentMonth === m) {
+            currentYear = null; currentMonth = null;
+        } else {
+            currentYear = y; currentMonth = m;
+        }
+        applyFilters();
+    }
+
+    function handleFilter() { applyFilters(); }
+
+    function clearFilters() {
+        currentYear = null; currentMonth = null;
+        document.getElementById('globalSearch').value = "";
+        applyFilters();
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;' })[c]);
+    }
+
+    function blockRows(list, field, unit) {
+        return list.map(o => {
+            let name = escapeHtml(o.name);
+            if (statsOrgPages.includes(o.name)) name = `<a href="orgs/${encodeURIComponent(o.name)}.html" class="text-decoration-none">${name}</a>`;
+            return `
+            <div class="p-2 border-bottom small d-flex justify-content-between align-items-center">
+                <span>${name}</span><span class="badge bg-light text-dark">${o[field]} ${unit}</span>
+            </div>`;
+        }).join('') || '<p class="text-muted p-3">無</p>';
+    }
+
+    function applyFilters() {
+        const keyword = document.getElementById('globalSearch').value.toLowerCase();
+        const orgs = {};
+        const timeMap = {};
+        const visible = new Set();
+        let totalCases = 0, orderCount = 0, winCount = 0;
+
+        statsItems.forEach(item => {
+            const matchSearch = item.title.toLowerCase().includes(keyword) ||
+                                item.orgs.some(o => o.toLowerCase().includes(keyword));
+            if (!matchSearch) return;
+            totalCases++;
+            if (item.category_key === 'administrative_actions') orderCount++;
+            item.orgNames.forEach(name => {
+                if (!orgs[name]) orgs[name] = { name, invest: 0, hearing: 0, action: 0 };
+                if (item.category_key === 'investigations') orgs[name].invest++;
+                if (item.category_key === 'hearings') orgs[name].hearing++;
+                if (item.category_key === 'administrative_actions') orgs[name].action++;
+            });
+            item.events.forEach(e => {
+                if (!timeMap[e.y]) timeMap[e.y] = { total: 0 };
+                timeMap[e.y][e.m] = (timeMap[e.y][e.m] || 0) + 1;
+                timeMap[e.y].total++;
+                if ((!currentYear || e.y === currentYear) && (!currentMonth || e.m === currentMonth)) {
+                    visible.add(e.key);
+                    if (e.outcome === 'win') winCount++;
+                }
+            });
+        });
+
+        document.getElementById('kpi-cases').textContent = totalCases;
+        document.getElementById('kpi-orders').textContent = orderCount;
+        document.getElementById('kpi-wins').textContent = winCount;
+
+        const years = Object.keys(timeMap).sort((a, b) => b - a);
+        document.getElementById('calendar-view').innerHTML = years.map(y => `
+                <div class="year-row d-flex align-items-start">
+                    <div class="year-label">${y}</div>
+                    <div class="month-grid">
+                        ${Array.from({ length: 12 }, (_, i) => {
+                            const ms = (i + 1).toString().padStart(2, '0');
+                            const count = timeMap[y][ms] || 0;
+                            const active = currentYear === parseInt(y) && currentMonth === ms;
+                            return `
+                                <div class="month-btn ${active ? 'active' : ''}" onclick="selectMonth(${parseInt(y)}, '${ms}')">
+                                    <span style="font-size:0.8rem">${i + 1}月</span>
+                                    ${count > 0 ? `<span class="count-dot">${count}</span>` : ''}
+                                </div>`;
+                        }).join('')}
+                    </div>
+                </div>`).join('') || '<p class="text-muted">查無時間資料</p>';
+
+        const orgList = Object.values(orgs);
+        document.getElementById('b-invest').innerHTML = blockRows(orgList.filter(o => o.invest > 0 && o.action === 0), 'invest', '調查');
+        document.getElementById('b-hearing').innerHTML = blockRows(orgList.filter(o => o.hearing > 0 && o.action === 0), 'hearing', '聽證');
+
+        let shown = 0;
+        document.querySelectorAll('#log-view .log-item').forEach(el => {
+            const match = visible.has(el.dataset.key);
+            el.style.display = match ? '' : 'none';
+            if (match) shown++;
+        });
+        document.getElementById('log-empty').style.display = shown ? 'none' : '';
+    }
+</script>"""
+
+
+def json_for_script(value):
+    # 嵌入 <script> 時避免資料中的 "</script>" 提前結束標籤
+    return json.dumps(value, ensure_ascii=False).replace('</', '<\\/')
+
+
+def root_script(root):
+    return f"<script>const SITE_ROOT = {json_for_script(root)};</script>"
+
+
+def org_href(root, name):
+    return f"{root}orgs/{quote(name)}.html"
+
+
+def dashboard_page(title, root, active, org_names, content, scripts=""):
+    org_nav = "".join(
+        f'<li class="nav-item"><a class="nav-link {"active" if active == name else ""}" href="{org_href(root, name)}">'
+        f'<i class="bi bi-building me-2"></i>{escape(name[:12])}</a></li>'
+        for name in org_names)
+    body = f"""<div class="mobile-header">
+    <div class="d-flex align-items-center"><i class="bi bi-shield-shaded fs-4 me-2"></i><span class="fw-bold">CIPAS View</span></div>
+    <button class="btn btn-dark" onclick="toggleSidebar()"><i class="bi bi-list"></i></button>
+</div>
+
+<nav id="sidebar">
+    <div class="mb-4 d-none d-lg-flex align-items-center"><i class="bi bi-shield-shaded fs-3 me-2 text-primary"></i><h4 class="fw-bold mb-0">CIPAS</h4></div>
+    <input type="text" id="global-search" class="search-box" placeholder="搜尋案件、處分、原告..." onkeyup="handleSearch(event)">
+    <ul class="nav flex-column" id="main-nav">
+        <li class="nav-item"><a class="nav-link {"active" if active == "home" else ""}" href="{root}index.html"><i class="bi bi-speedometer2 me-2"></i>概覽</a></li>
+        <li class="nav-item"><a class="nav-link" href="{root}stats.html"><i class="bi bi-graph-up-arrow me-2"></i>數據統計庫</a></li>
+        <li class="nav-item"><a class="nav-link" href="{root}meetings/index.html"><i class="bi bi-journal-text me-2"></i>會議紀錄智庫</a></li>
+    </ul>
+    <div class="small text-muted mt-4 mb-2 px-3 text-uppercase">組織生命週期</div>
+    <ul class="nav flex-column" id="org-nav">{org_nav}</ul>
+</nav>
+
+<main id="main-content">
+    <div id="view-container">{content}</div>
+</main>"""
+    return page_shell(title, STYLES['dashboard'], body, root_script(root) + DASHBOARD_SCRIPT + scripts)
+
+
+def meetings_page(title, root, active, content, scripts=""):
+    def nav(key, href, icon, label):
+        return (f'<li class="nav-item"><a class="nav-link {"active" if active == key else ""}" href="{href}">'
+                f'<i class="bi {icon} me-2"></i> {label}</a></li>')
+    body = f"""<nav id="sidebar">
+    <div class="mb-5 px-2">
+        <h4 class="fw-bold"><i class="bi bi-cpu-fill me-2"></i>CIPAS Intelligence</h4>
+        <small class="text-slate-400">決策審計與人名關聯系統</small>
+    </div>
+    <ul class="nav flex-column">
+        {nav('home', f'{root}index.html', 'bi-arrow-left-circle', '案件儀表板')}
+        {nav('list', f'{root}meetings/index.html', 'bi-table', '會議清單')}
+        {nav('members', f'{root}meetings/members.html', 'bi-people', '委員出席庫')}
+        {nav('audit', f'{root}meetings/audit.html', 'bi-bank', '財政動支審計')}
+        {nav('org-budget', f'{root}meetings/budget/index.html', 'bi-calendar-range', '組織預算追蹤')}
+    </ul>
+</nav>
+
+<main id="main-content">
+    <div id="view-container">{content}</div>
+</main>"""
+    return page_shell(title, STYLES['meetings'], body, BOOTSTRAP_JS + scripts)
+
+
+def linkify_admin_actions(text, links, root):
+    def replace(match):
+        target = links.get(match.group(1))
+        if target:
+            return (f'<a href="{root}cases/{quote(target)}.html" class="admin-action-link">'
+                    f'<i class="bi bi-link-45deg"></i>{match.group(0)}</a>')
+        return match.group(0)
+    return ADMIN_ACTION_PATTERN.sub(replace, escape(text))
+
+
+# --- 案件儀表板頁面 ---
+def render_overview(vm):
+    root = ""
+    kpi = vm['kpi']
+    org_cards = "".join(f"""
+                    <div class="col-md-4">
+                        <div class="card glass-card p-3 h-100">
+                            <h5 class="fw-bold">{escape(o['name'])}</h5><p class="text-muted small">關聯處分與程序：{o['count']} 筆</p>
+                            <a href="{org_href(root, o['name'])}" class="btn btn-sm btn-outline-primary mt-auto">查看處分生命週期</a>
+                        </div>
+                    </div>""" for o in vm['orgs'])
+    content = f"""
+            <h1 class="fw-bold mb-4">黨產處分司法防線儀錶板</h1>
+            <div class="row g-4 mb-5">
+                <div class="col-md-3"><div class="card glass-card kpi-card p-4">
+                    <small class="text-muted text-uppercase fw-bold">處分成果</small>
+                    <h2 class="display-6 fw-bold mb-0">{kpi['orders']} <span class="fs-6 text-primary">項作成</span></h2>
+                </div></div>
+                <div class="col-md-3"><div class="card glass-card kpi-card p-4" style="border-left-color: #198754;">
+                    <small class="text-muted text-uppercase fw-bold">司法防線穩固</small>
+                    <h2 class="display-6 fw-bold mb-0">{kpi['won']} <span class="fs-6 text-success">案維持</span></h2>
+                </div></div>
+                <div class="col-md-3"><div class="card glass-card kpi-card p-4" style="border-left-color: #dc3545;">
+                    <small class="text-muted text-uppercase fw-bold">司法撤銷受挫</small>
+                    <h2 class="display-6 fw-bold mb-0">{kpi['lost']} <span class="fs-6 text-danger">案撤銷</span></h2>
+                </div></div>
+                <div class="col-md-3"><div class="card glass-card kpi-card p-4" style="border-left-color: #0dcaf0;">
+                    <small class="text-muted text-uppercase fw-bold">整體維持率</small>
+                    <h2 class="display-6 fw-bold mb-0">{kpi['stability']}% <span class="fs-6 text-info">法理穩固</span></h2>
+                </div></div>
+            </div>
+            <div class="row g-4">{org_cards}
+            </div>"""
+    return dashboard_page('CIPAS 全生命週期監控系統 (深度績效版)', root, 'home', vm['org_names'], content)
+
+
+def render_case_index(vm):
+    root = "../"
+    cards = "".join(f"""
+                    <div class="col-md-6 col-lg-4" data-search="{escape(c['search'])}">
+                        <a class="card glass-card p-3 h-100 case-card text-decoration-none text-dark" href="{quote(c['id'])}.html">
+                            <span class="badge {c['status']['class']} mb-2" style="width:fit-content">{escape(c['status']['label'])}</span>
+                            <h6 class="fw-bold">{escape(c['title'])}</h6>
+                            <p class="text-muted small mb-0">{escape(c['category'])}</p>
+                        </a>
+                    </div>""" for c in vm['cases'])
+    content = f"""
+            <div class="mb-4"><a href="{root}index.html" class="text-muted text-decoration-none">← 返回概覽</a></div>
+            <div class="d-flex flex-wrap gap-3 align-items-center mb-4">
+                <h3 class="fw-bold mb-0">案件搜尋 <span class="badge bg-primary fs-6" id="result-count">{len(vm['cases'])}</span></h3>
+                <input type="text" id="list-filter" class="form-control" style="max-width:360px" placeholder="輸入關鍵字過濾案件...">
+            </div>
+            <div class="row g-3">{cards}
+            </div>"""
+    return dashboard_page('案件搜尋 - CIPAS', root, None, vm['org_names'], content, FILTER_SCRIPT)
+
+
+def render_mini_card(c, root):
+    return f"""<a class="case-card shadow-sm p-2 mb-2 d-block text-decoration-none" href="{root}cases/{quote(c['id'])}.html" style="border-radius:6px; font-size:0.75rem;">
+            <div class="fw-bold" style="color:#2d3748; line-height:1.2;">{escape(c['title'])}</div>
+            <span class="status-badge {c['status']['class']} mt-1" style="font-size:0.55rem; display:inline-block;">{escape(c['status']['label'])}</span>
+        </a>"""
+
+
+def render_org(vm):
+    root = "../"
+    stages = [
+        ('investigations', 'text-muted', 'bi-search', '01 調查啟動', '不適用或併案', ''),
+        ('hearings', 'text-info', 'bi-chat-left-dots', '02 聽證程序', '無公開聽證紀錄', ''),
+        ('administrative_actions', 'text-danger', 'bi-hammer', '03 行政處分', '處分尚未作成',
+         ' style="background: #fff5f5; border-color: #feb2b2;"'),
+        ('litigations', 'text-primary', 'bi-shield-shaded', '04 司法訴訟', '尚無訴訟紀錄',
+         ' style="background: #f0f7ff; border-color: #bee3f8;"'),
+    ]
+    sections = []
+    for matter in vm['matters']:
+        columns = []
+        for key, color, icon, label, empty, style in stages:
+            cards = "".join(render_mini_card(c, root) for c in matter['cases'] if c['category_key'] == key)
+            columns.append(f"""
+                            <div class="flow-stage"{style}>
+                                <div class="stage-label {color}"><i class="bi {icon}"></i> {label}</div>
+                                {cards or f'<div class="text-muted small italic">{empty}</div>'}
+                            </div>""")
+        arrow = '\n                            <div class="flow-arrow"><i class="bi bi-chevron-right"></i></div>'
+        sections.append(f"""
+                    <div class="matter-section">
+                        <h4 class="matter-title">{escape(matter['name'])}</h4>
+                        <div class="flow-container">{arrow.join(columns)}
+                        </div>
+                    </div>""")
+    content = f"""
+            <div class="mb-3"><a href="{root}index.html" class="text-decoration-none text-muted"><i class="bi bi-arrow-left"></i> 返回概覽</a></div>
+            <h1 class="fw-bold mb-5">{escape(vm['name'])} 處分生命週期圖譜</h1>
+            <div class="lifecycle-timeline">{"".join(sections)}
+            </div>"""
+    return dashboard_page(f"{vm['name']} - CIPAS", root, vm['name'], vm['org_names'], content)
+
+
+def render_case(vm):
+    root = "../"
+    item = vm['item']
+    links = vm['admin_links']
+
+    def linkify(text):
+        return linkify_admin_actions(text, links, root)
+
+    if item['category_key'] == 'litigations':
+        grouped = group_litigation_events(item['events'], vm['protagonists'])
+        plaintiff_keys = [k for k in grouped if k.startswith('原告：')]
+        common_events = grouped['處分基礎與共同事件']
+        if len(plaintiff_keys) <= 1:
+            single_key = plaintiff_keys[0] if plaintiff_keys else None
+            display_events = sorted(common_events + (grouped[single_key] if single_key else []),
+                                    key=date_key, reverse=True)
+            status = analyze_litigation_status(grouped[single_key]) if single_key \
+                else {'label': '程序處理中', 'class': 'bg-secondary text-white'}
+            header = (f'<div class="mb-4"><h6 class="fw-bold">{escape(single_key)}</h6>'
+                      f'<span class="badge {status["class"]}">{escape(status["label"])}</span></div>') if single_key else ''
+            rows = "".join(f"""
+                            <div class="mb-3 border-start ps-3 border-3 {'border-danger' if '作成' in e['caption'] else 'border-primary'}">
+                                <b>{e['date']}</b> {linkify(e['caption'])}
+                                <div class="text-muted small mt-1">{linkify(e['description'])}</div>
+                            </div>""" for e in display_events)
+            content_html = f'<div class="mt-4">{header}{rows}</div>'
+        else:
+            common = ""
+            if common_events:
+                common = ('<div class="mb-4 p-3 bg-light rounded border"><h6>處分基礎與共同事件</h6><div class="small">'
+                          + "".join(f"<div>{e['date']} {linkify(e['caption'])}</div>" for e in common_events)
+                          + '</div></div>')
+            cards = []
+            for k in plaintiff_keys:
+                status = analyze_litigation_status(grouped[k])
+                rows = "".join(f'<div class="small border-start ps-2 mb-2"><b>{e["date"]}</b><br>{linkify(e["caption"])}</div>'
+                               for e in sorted(grouped[k], key=date_key, reverse=True))
+                cards.append(f"""
+                        <div class="col-md-6"><div class="card p-3 h-100 shadow-sm border-top border-primary border-4">
+                            <h6 class="fw-bold mb-1">{escape(k)}</h6><span class="badge {status['class']} mb-3" style="width:fit-content">{escape(status['label'])}</span>
+                            {rows}
+                        </div></div>""")
+            content_html = f'{common}<div class="row g-3">{"".join(cards)}</div>'
+    else:
+        content_html = '<div class="mt-4">' + "".join(
+            f'<div class="mb-3 border-start ps-3 border-3"><b>{e["date"]}</b> {linkify(e["caption"])}'
+            f'<div class="text-muted small mt-1">{linkify(e["description"])}</div></div>'
+            for e in sorted(item['events'], key=date_key, reverse=True)) + '</div>'
+
+    tags = "".join(f'<span class="protagonist-tag shadow-sm mb-2">{escape(p)}</span>' for p in vm['protagonists'])
+    content = f"""<div class="mb-4"><button onclick="history.back()" class="btn btn-link p-0 text-muted text-decoration-none">← 返回</button></div>
+            <div class="card glass-card p-4 p-md-5 position-relative">
+                <div class="mb-4 d-flex flex-column flex-lg-row justify-content-between align-items-start">
+                    <div class="detail-header-text">
+                        <span class="badge {item['displayStatus']['class']} mb-2">{escape(item['displayStatus']['label'])}</span>
+                        <h2 class="fw-bold">{escape(item['title'])}</h2>
+                        <p class="text-muted small">{escape(item['category'])} | <a href="{escape(item['url'])}" target="_blank">官方連結</a></p>
+                    </div>
+                    <div class="mt-3 mt-lg-0 d-flex flex-column align-items-lg-end">
+                        {tags}
+                    </div>
+                </div>
+                <hr>{content_html}</div>"""
+    return dashboard_page(f"{item['title']} - CIPAS", root, None, vm['org_names'], content)
+
+
+# --- 數據統計頁 (移植自 stats.html，預設為未過濾狀態) ---
+def build_stats_vm(raw_cases, org_pages):
+    orgs = {}
+    events = []
+    time_map = {}
+    items = []
+    for idx, item in enumerate(raw_cases):
+        org_names = [a['org_full'] for a in item['analysis']] or ["(未識別) " + item['title'][:12]]
+        item_events = []
+        for name in org_names:
+            o = orgs.setdefault(name, {'name': name, 'invest': 0, 'hearing': 0, 'action': 0})
+            if item['category_key'] == 'investigations': o['invest'] += 1
+            if item['category_key'] == 'hearings': o['hearing'] += 1
+            if item['category_key'] == 'administrative_actions': o['action'] += 1
+        for i, e in enumerate(item['events']):
+            d = parse_date(e['date'])
+            if not d:
+                continue
+            y, m = d.year, f"{d.month:02d}"
+            year = time_map.setdefault(str(y), {'total': 0})
+            year[m] = year.get(m, 0) + 1
+            year['total'] += 1
+            outcome = 'normal'
+            if '駁回' in e['caption'] or '不停止執行' in e['caption']: outcome = 'win'
+            if '撤銷' in e['caption'] or '停止執行' in e['caption']: outcome = 'lose'
+            key = f"{idx}:{i}"
+            item_events.append({'key': key, 'y': y, 'm': m, 'outcome': outcome})
+            events.append({'dateStr': e['date'], 'y': y, 'm': m, 'org': org_names[0],
+                           'caption': e['caption'], 'desc': e.get('description', ''),
+                           'outcome': outcome, 'id': item['id'], 'key': key})
+        # 供頁面上的過濾器重算統計，搜尋比對方式與 stats.html 相同 (標題與各組織分別比對)
+        items.append({'title': item['title'], 'orgs': [a['org_full'] for a in item['analysis']],
+                      'orgNames': org_names, 'category_key': item['category_key'], 'events': item_events})
+    events.sort(key=lambda e: parse_date(e['dateStr']), reverse=True)
+    return {
+        'kpi': {
+            'cases': len(raw_cases),
+            'orders': sum(1 for i in raw_cases if i['category_key'] == 'administrative_actions'),
+            'wins': sum(1 for e in events if e['outcome'] == 'win')
+        },
+        'time_map': time_map,
+        'only_invest': [o for o in orgs.values() if o['invest'] > 0 and o['action'] == 0],
+        'only_hearing': [o for o in orgs.values() if o['hearing'] > 0 and o['action'] == 0],
+        'events': events,
+        'items': items,
+        'org_pages': org_pages
+    }
+
+
+def render_stats(vm):
+    root = ""
+    kpi = vm['kpi']
+    years = sorted(vm['time_map'], key=int, reverse=True)
+    cal_html = ""
+    for y in years:
+        months = ""
+        for i in range(12):
+            ms = f"{i + 1:02d}"
+            count = vm['time_map'][y].get(ms, 0)
+            months += f"""
+                                <div class="month-btn" onclick="selectMonth({y}, '{ms}')">
+                                    <span style="font-size:0.8rem">{i + 1}月</span>
+                                    {f'<span class="count-dot">{count}</span>' if count > 0 else ''}
+                                </div>"""
+        cal_html += f"""
+                <div class="year-row d-flex align-items-start">
+                    <div class="year-label">{y}</div>
+                    <div class="month-grid">{months}
+                    </div>
+                </div>"""
+
+    def block_rows(orgs, field, unit):
+        rows = ""
+        for o in orgs:
+            name = escape(o['name'])
+            if o['name'] in vm['org_pages']:
+                name = f'<a href="{org_href(root, o["name"])}" class="text-decoration-none">{name}</a>'
+            rows += f"""
+            <div class="p-2 border-bottom small d-flex justify-content-between align-items-center">
+                <span>{name}</span><span class="badge bg-light text-dark">{o[field]} {unit}</span>
+            </div>"""
+        return rows or '<p class="text-muted p-3">無</p>'
+
+    log_html = "".join(f"""
+            <div class="log-item {'court-win' if e['outcome'] == 'win' else ('court-lose' if e['outcome'] == 'lose' else '')}" data-key="{e['key']}">
+                <div class="d-flex justify-content-between x-small text-muted mb-1">
+                    <span class="fw-bold text-primary">{escape(e['org'])}</span><span>{e['dateStr']}</span>
+                </div>
+                <div class="fw-bold small">{escape(e['caption'])}</div>
+                {f'<div class="desc-box">{escape(e["desc"][:200])}...</div>' if e['desc'] else ''}
+                <div class="mt-2 text-end">
+                    <a href="cases/{quote(e['id'])}.html" class="btn btn-sm btn-link p-0 text-decoration-none" style="font-size:0.75rem">進入案件詳細頁 →</a>
+                </div>
+            </div>""" for e in vm['events'])
+
+    body = f"""<div class="container-fluid py-4 px-lg-5">
+    <div class="d-flex justify-content-between align-items-center mb-4">
+        <div>
+            <h1 class="fw-bold mb-0">CIPAS 終極績效監控看板</h1>
+            <p class="text-muted small">年度統計、司法勝率、程序阻塞與深度日誌一站式呈現</p>
+        </div>
+        <div class="d-flex gap-2 align-items-center">
+            <div class="search-container">
+                <i class="bi bi-search search-icon"></i>
+                <input type="text" id="globalSearch" class="form-control search-input" placeholder="搜尋組織、標題或主文..." onkeyup="handleFilter()">
+            </div>
+            <a href="index.html" class="btn btn-dark"><i class="bi bi-diagram-3 me-2"></i> 流水線模式</a>
+            <a href="meetings/index.html" class="btn btn-outline-dark"><i class="bi bi-journal-text me-2"></i> 會議紀錄智庫</a>
+        </div>
+    </div>
+
+    <div id="kpi-row" class="row g-4 mb-4">
+            <div class="col-md-4"><div class="stats-card kpi-card"><h3 id="kpi-cases">{kpi['cases']}</h3><small class="text-muted">總程序件數</small></div></div>
+            <div class="col-md-4"><div class="stats-card kpi-card" style="border-top-color:#dc3545"><h3 id="kpi-orders">{kpi['orders']}</h3><small class="text-muted">核心行政處分</small></div></div>
+            <div class="col-md-4"><div class="stats-card kpi-card" style="border-top-color:#198754"><h3 id="kpi-wins">{kpi['wins']}</h3><small class="text-muted">法院勝訴裁定</small></div></div>
+    </div>
+
+    <div class="row">
+        <div class="col-lg-6">
+            <div class="stats-card">
+                <h5 class="fw-bold mb-4"><i class="bi bi-calendar3 me-2 text-primary"></i>年度月份發案統計 (點擊月份可過濾日誌)</h5>
+                <div id="calendar-view">{cal_html or '<p class="text-muted">查無時間資料</p>'}</div>
+            </div>
+
+            <div class="stats-card">
+                <h5 class="fw-bold mb-3"><i class="bi bi-hourglass-split me-2 text-warning"></i>程序阻塞分析 (尚未作成行政處分)</h5>
+                <ul class="nav nav-pills mb-3" id="blockTab">
+                    <li class="nav-item"><button class="nav-link active py-1 px-3 small" data-bs-toggle="pill" data-bs-target="#b-invest">僅調查案</button></li>
+                    <li class="nav-item"><button class="nav-link py-1 px-3 small" data-bs-toggle="pill" data-bs-target="#b-hearing">僅聽證案</button></li>
+                </ul>
+                <div class="tab-content" id="blockTabContent" style="max-height: 300px; overflow-y: auto;">
+                    <div class="tab-pane fade show active" id="b-invest">{block_rows(vm['only_invest'], 'invest', '調查')}</div>
+                    <div class="tab-pane fade" id="b-hearing">{block_rows(vm['only_hearing'], 'hearing', '聽證')}</div>
+                </div>
+            </div>
+        </div>
+
+        <div class="col-lg-6">
+            <div class="stats-card">
+                <div class="d-flex justify-content-between align-items-center mb-4">
+                    <h5 class="fw-bold mb-0"><i class="bi bi-file-earmark-text me-2 text-info"></i>程序與司法裁定詳細日誌</h5>
+                    <button class="btn btn-sm btn-link text-decoration-none" onclick="clearFilters()">清除過濾</button>
+                </div>
+                <div id="log-view" class="log-container">{log_html}
+                    <p id="log-empty" class="text-muted p-4 text-center" style="{'display:none' if vm['events'] else ''}">查無進度資料，請嘗試清除過濾。</p>
+                </div>
+            </div>
+        </div>
+    </div>
+</div>"""
+    data = (f"<script>const statsItems = {json_for_script(vm['items'])};\n"
+            f"const statsOrgPages = {json_for_script(vm['org_pages'])};</script>")
+    return page_shell('CIPAS 終極績效監控看板', STYLES['stats'], body, data + '\n' + STATS_SCRIPT + '\n' + BOOTSTRAP_JS)
+
+
+# --- 會議紀錄頁面 ---
+def render_meeting_index(vm):
+    root = "../"
+    rows = "".join(f"""
+                    <div class="col-12" data-search="{escape(d['title'])}">
+                        <a class="card border-0 shadow-sm p-3 member-card text-decoration-none text-dark" href="{quote(d['id'])}.html">
+                            <div class="d-flex justify-content-between">
+                                <h6 class="fw-bold mb-0">{escape(d['title'])}</h6>
+                                <span class="text-muted small">{d['date']}</span>
+                            </div>
+                        </a>
+                    </div>""" for d in vm['meetings'])
+    content = f"""
+            <div class="d-flex justify-content-between align-items-center mb-4">
+                <h2 class="fw-bold">會議深度紀錄列表</h2>
+                <span class="badge bg-primary rounded-pill">共 <span id="result-count">{len(vm['meetings'])}</span> 筆資料</span>
+            </div>
+            <input type="text" id="list-filter" class="form-control mb-4" placeholder="輸入關鍵字過濾會議標題...">
+            <div class="row g-3">{rows}
+            </div>"""
+    return meetings_page('CIPAS 智庫 3.0 - 決策審計與人名關聯系統', root, 'list', content, FILTER_SCRIPT)
+
+
+def member_anchor(name):
+    return 'member-' + hashlib.md5(name.encode('utf-8')).hexdigest()[:8]
+
+
+def render_meeting(vm):
+    root = "../"
+    m = vm['meeting']
+    issues_html = ""
+    for issue, related in zip(m['issues'], vm['related']):
+        label, css, icon = ISSUE_STATUS.get(issue['status'], ISSUE_STATUS['pending'])
+        decision_parts = issue['decision'].split('：')
+        border = 'border-warning' if issue['status'] == 'partial' else ('border-success' if issue['status'] == 'agreed' else 'border-primary')
+        lifecycle = ""
+        if related['history']:
+            history = "".join(f'<a href="{quote(h["id"])}.html" class="related-item"><i class="bi bi-clock-history me-2"></i> {h["date"]} {escape(h["title"][:30])}...</a>'
+                              for h in related['history'])
+            notice = ('<div class="mt-2 text-warning x-small"><i class="bi bi-exclamation-triangle"></i> 注意：此議題目前僅為「洽悉」，需追蹤後續是否有實質討論。</div>'
+                      if issue['status'] == 'noted' else '')
+            lifecycle = f"""
+            <div class="lifecycle-indicator">
+                <div class="fw-bold text-primary mb-2 small"><i class="bi bi-diagram-3"></i> 跨會議議題鏈結：{escape(related['clean_title'])}</div>
+                <div class="timeline-mini">{history}</div>
+                {notice}
+            </div>"""
+        issues_html += f"""
+                        <div class="card border-0 shadow-sm mb-4">
+                            <div class="card-header bg-white border-bottom-0 pt-4 px-4 d-flex justify-content-between align-items-center">
+                                <span class="badge {'bg-primary' if issue['section'] == '討論' else 'bg-info'}">{issue['section']}案號：{issue['no']}</span>
+                                <div class="d-flex gap-2">
+                                    {"".join(f'<span class="money-tag">NT$ {escape(mon)}</span>' for mon in issue['money'])}
+                                    <span class="status-badge {css}">
+                                        <i class="bi {icon} me-1"></i> {label}
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="card-body px-4 pb-4">
+                                <h5 class="fw-bold mb-3 text-dark">{escape(issue['title'])}</h5>
+                                <p class="text-secondary small mb-3" style="line-height:1.7;">{'<br>'.join(escape(d) for d in issue['desc'])}</p>
+                                <div class="p-3 bg-light rounded border-start border-4 {border}">
+                                    <strong class="d-block mb-1">{escape(decision_parts[0])}</strong>
+                                    <div class="small text-dark">{escape(decision_parts[1]) if len(decision_parts) > 1 and decision_parts[1] else '內容參閱內文'}</div>
+                                </div>
+                                {lifecycle}
+                            </div>
+                        </div>"""
+    members = "".join(f'<a class="badge bg-light text-dark border p-2 text-decoration-none" href="members.html#{member_anchor(mem["name"])}">'
+                      f'{escape(mem["name"])} <small class="text-muted">{escape(mem["title"])}</small></a>'
+                      for mem in m['members'])
+    content = f"""
+            <div class="row g-4">
+                <div class="col-lg-8">
+                    <div class="card border-0 shadow-sm p-4 mb-4">
+                        <h2 class="fw-bold mb-3">{escape(m['title'])}</h2>
+                        <div class="d-flex gap-4 text-muted small">
+                            <span><i class="bi bi-calendar-event me-2"></i>{m['date']}</span>
+                            <span><i class="bi bi-geo-alt me-2"></i>{escape(m['location'])}</span>
+                        </div>
+                    </div>
+{issues_html}
+                </div>
+                <div class="col-lg-4">
+                    <div class="card border-0 shadow-sm p-4 sticky-top" style="top:2rem;">
+                        <h6 class="fw-bold mb-3">出席委員會員</h6>
+                        <div class="d-flex flex-wrap gap-2">{members}</div>
+                        <hr>
+                        <h6 class="fw-bold mb-3">列席單位</h6>
+                        <div class="small text-muted">{escape('、'.join(m['staff']))}</div>
+                    </div>
+                </div>
+            </div>"""
+    return meetings_page(f"{m['title']} - CIPAS 智庫", root, None, content)
+
+
+def render_members(vm):
+    root = "../"
+    cards = ""
+    for m in vm['members']:
+        anchor = member_anchor(m['name'])
+        meetings = "".join(f"""
+                        <a href="{quote(mt['id'])}.html" class="list-group-item list-group-item-action d-flex justify-content-between">
+                            <span>{escape(mt['title'])}</span><span class="text-muted small">{mt['date']}</span>
+                        </a>""" for mt in m['meetings'])
+        cards += f"""
+                    <div class="col-md-4" id="{anchor}">
+                        <div class="card border-0 shadow-sm p-4 member-card" data-bs-toggle="collapse" data-bs-target="#{anchor}-list">
+                            <h5 class="fw-bold mb-1">{escape(m['name'])}</h5>
+                            <div class="text-primary small mb-3">{escape(m['title'])}</div>
+                            <div class="d-flex justify-content-between align-items-end">
+                                <div><span class="display-6 fw-bold">{len(m['meetings'])}</span><span class="text-muted"> 場會議</span></div>
+                                <div class="text-success small">出席率: {m['rate']}%</div>
+                            </div>
+                        </div>
+                        <div class="collapse list-group list-group-flush mt-2" id="{anchor}-list">{meetings}
+                        </div>
+                    </div>"""
+    content = f"""
+            <h2 class="fw-bold mb-4">委員出席率與活躍度分析</h2>
+            <div class="row g-4">{cards}
+            </div>"""
+    # 由會議頁跳轉時自動展開對應委員的出席明細
+    script = """<script>
+    if (location.hash) {
+        const list = document.querySelector(location.hash + '-list');
+        if (list) new bootstrap.Collapse(list, { toggle: true });
+    }
+</script>"""
+    return meetings_page('委員出席庫 - CIPAS 智庫', root, 'members', content, script)
+
+
+def render_audit(vm):
+    root = "../"
+    rows = "".join(f"""
+                            <tr>
+                                <td class="small"><a href="{quote(i['id'])}.html">{escape(i['meeting'])}</a></td>
+                                <td class="fw-bold">{escape(i['title'])}</td>
+                                <td>{"".join(f'<span class="money-tag d-block mb-1">NT$ {escape(mon)}</span>' for mon in i['money'])}</td>
+                                <td><span class="status-badge status-{i['status']}">{i['status']}</span></td>
+                            </tr>""" for i in vm['issues'])
+    content = f"""
+            <h2 class="fw-bold mb-4">財政動支審計 (金額追蹤)</h2>
+            <div class="table-responsive bg-white rounded shadow-sm">
+                <table class="table table-hover align-middle mb-0">
+                    <thead class="bg-light">
+                        <tr><th>日期/會議</th><th>議題</th><th>金額 (NT$)</th><th>決策狀態</th></tr>
+                    </thead>
+                    <tbody>{rows}
+                    </tbody>
+                </table>
+            </div>"""
+    return meetings_page('財政動支審計 - CIPAS 智庫', root, 'audit', content)
+
+
+def render_budget_index(vm):
+    root = "../../"
+    cards = "".join(f"""
+                        <div class="col-md-4">
+                            <a class="card border-0 shadow-sm p-4 member-card text-decoration-none text-dark" href="{quote(name)}.html">
+                                <h5 class="fw-bold mb-2">{escape(name)}</h5>
+                                <div class="text-muted small">追蹤歷月營運支出與現金動支案</div>
+                                <div class="mt-3 text-primary fw-bold">進入專用閱讀視角 →</div>
+                            </a>
+                        </div>""" for name in vm['orgs'])
+    content = f"""
+                <h2 class="fw-bold mb-4">組織預算追蹤中心</h2>
+                <div class="row g-4">{cards}
+                </div>"""
+    return meetings_page('組織預算追蹤 - CIPAS 智庫', root, 'org-budget', content)
+
+
+def render_budget_org(vm):
+    root = "../../"
+    rows = ""
+    for i in vm['issues']:
+        border = 'border-success' if i['status'] == 'agreed' else ('border-warning' if i['status'] == 'partial' else 'border-primary')
+        decision_parts = i['decision'].split('：')
+        rows += f"""
+                    <div class="card border-0 shadow-sm mb-3">
+                        <div class="card-body p-3">
+                            <div class="d-flex justify-content-between align-items-start mb-2">
+                                <span class="badge bg-light text-dark border">{i['meetingDate']}</span>
+                                <div class="d-flex gap-2">
+                                    {"".join(f'<span class="money-tag">NT$ {escape(mon)}</span>' for mon in i['money'])}
+                                    <span class="status-badge status-{i['status']}">{i['status']}</span>
+                                </div>
+                            </div>
+                            <h6 class="fw-bold"><a href="../{quote(i['meetingId'])}.html" class="text-dark text-decoration-none">{escape(i['title'])}</a></h6>
+                            <div class="bg-light p-2 rounded mt-2 small border-start border-3 {border}">
+                                <strong>決策內容：</strong>{escape(decision_parts[1]) if len(decision_parts) > 1 and decision_parts[1] else '內容參閱內文'}
+                            </div>
+                        </div>
+                    </div>"""
+    content = f"""
+            <div class="mb-4"><a href="index.html" class="btn btn-sm btn-light border"><i class="bi bi-chevron-left"></i> 返回選擇</a></div>
+            <h2 class="fw-bold mb-4">{escape(vm['name'])} 預算動支追蹤矩陣</h2>
+            <div class="timeline-mini">{rows}
+            </div>"""
+    return meetings_page(f"{vm['name']} 預算動支 - CIPAS 智庫", root, 'org-budget', content)
+
+
+# --- 頁面規劃：每頁對應一份 view model，內容雜湊即以 view model 計算 ---
+def plan_pages(raw_cases, raw_meetings):
+    cases = [analyze_item(item) for item in raw_cases]
+    org_map = build_org_map(cases)
+    org_names = [name for name in OFFICIAL_ORGS if name in org_map]
+    pages = []
+
+    def summary(c):
+        return {'id': c['id'], 'title': c['title'], 'category_key': c['category_key'], 'status': c['displayStatus']}
+
+    lits = [c for c in cases if c['category_key'] == 'litigations']
+    won = sum(1 for c in lits if c['displayStatus']['score'] == 1)
+    lost = sum(1 for c in lits if c['displayStatus']['score'] == -1)
+    pages.append(('index.html', render_overview, {
+        'kpi': {
+            'orders': sum(1 for c in cases if c['category_key'] == 'administrative_actions'),
+            'won': won, 'lost': lost,
+            'stability': round_half_up(won / (won + lost) * 100) if won + lost > 0 else 0
+        },
+        'orgs': [{'name': name, 'count': len(org_map[name])} for name in org_names],
+        'org_names': org_names
+    }))
+
+    pages.append(('cases/index.html', render_case_index, {
+        'cases': [{**summary(c), 'category': c['category'],
+                   'search': ' '.join([c['title']] + [e['caption'] + e['description'] for e in c['events']])}
+                  for c in cases],
+        'org_names': org_names
+    }))
+
+    for c in cases:
+        protagonists = [p for p in unique(NAME_NORMALIZATION.get(a['org_full'], a['org_full']) for a in c['analysis'])
+                        if p in OFFICIAL_ORGS]
+        pages.append((f"cases/{c['id']}.html", render_case, {
+            'item': c, 'protagonists': protagonists,
+            'admin_links': find_admin_links(c, cases), 'org_names': org_names
+        }))
+
+    for name in org_names:
+        matters = {}
+        for c in org_map[name]:
+            matters.setdefault(c['matter'], []).append(summary(c))
+        pages.append((f"orgs/{name}.html", render_org, {
+            'name': name,
+            'matters': [{'name': m, 'cases': matters[m]} for m in MATTER_ORDER if m in matters],
+            'org_names': org_names
+        }))
+
+    pages.append(('stats.html', render_stats, build_stats_vm(raw_cases, org_names)))
+
+    parsed = [deep_parse_meeting(d) for d in raw_meetings]
+    pages.append(('meetings/index.html', render_meeting_index, {
+        'meetings': [{'id': m['id'], 'title': m['title'], 'date': m['date']}
+                     for m in sorted(parsed, key=lambda m: int(m['id']), reverse=True)]
+    }))
+
+    for m in parsed:
+        pages.append((f"meetings/{m['id']}.html", render_meeting, {
+            'meeting': m,
+            'related': [find_related_meetings(issue, m['id'], raw_meetings) for issue in m['issues']]
+        }))
+
+    member_stats = build_member_stats(parsed)
+    members = sorted(member_stats.values(), key=lambda m: len(m['meetings']), reverse=True)
+    pages.append(('meetings/members.html', render_members, {
+        'members': [{**m, 'meetings': sorted(m['meetings'], key=lambda mt: int(mt['id']), reverse=True),
+                     'rate': round_half_up(len(m['meetings']) / len(raw_meetings) * 100)}
+                    for m in members]
+    }))
+
+    pages.append(('meetings/audit.html', render_audit, {
+        'issues': [{'title': i['title'], 'money': i['money'], 'status': i['status'], 'meeting': m['title'], 'id': m['id']}
+                   for m in parsed for i in m['issues'] if i['money']]
+    }))
+
+    pages.append(('meetings/budget/index.html', render_budget_index, {'orgs': [o['name'] for o in KEY_ORGS]}))
+    for org in KEY_ORGS:
+        related = [{'title': i['title'], 'money': i['money'], 'status': i['status'], 'decision': i['decision'],
+                    'meetingDate': m['date'], 'meetingId': m['id']}
+                   for m in parsed for i in m['issues']
+                   if any(k in i['title'] for k in org['keywords']) and ('支出' in i['title'] or '預算' in i['title'])]
+        related.sort(key=lambda i: parse_date(i['meetingDate']) or datetime.min, reverse=True)
+        pages.append((f"meetings/budget/{org['name']}.html", render_budget_org, {'name': org['name'], 'issues': related}))
+
+    return pages
+
+
+# --- 增量建置 ---
+def build_fingerprint():
+    """建置程式或樣式來源變動時，所有頁面都需要重建。"""
+    digest = hashlib.sha256()
+    for path in (__file__, *STYLE_SOURCES.values()):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def content_hash(fingerprint, vm):
+    payload = json.dumps(vm, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256((fingerprint + payload).encode('utf-8')).hexdigest()
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        return load_json(path).get('pages', {})
+    except (ValueError, OSError):
+        return {}
+
+
+def is_generated_page(path):
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return GENERATED_MARKER in f.read(512)
+
+
+def remove_stale_pages(output_dir, current, previous):
+    """刪除不屬於本次建置、且可確認由本工具產生的 .html，並清掉因此變空的目錄。"""
+    removed = 0
+    for dirpath, _, filenames in os.walk(output_dir, topdown=False):
+        touched = False
+        for name in filenames:
+            if not name.endswith('.html'):
+                continue
+            path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(path, output_dir).replace(os.sep, '/')
+            if rel_path in current:
+                continue
+            if rel_path in previous or is_generated_page(path):
+                os.remove(path)
+                removed += 1
+                touched = True
+        if touched and dirpath != output_dir and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return removed
+
+
+def check_output_dir(output_dir):
+    """拒絕輸出到專案根目錄或含有看板原始檔的目錄，避免覆寫或刪除手寫頁面。"""
+    target = os.path.realpath(output_dir)
+    project_root = os.path.dirname(os.path.realpath(__file__))
+    # site/stats.html 為本工具輸出，只有非產生的同名檔案才視為看板原始檔
+    sources = [os.path.join(target, path) for path in STYLE_SOURCES.values()]
+    if target == project_root or any(os.path.exists(p) and not is_generated_page(p) for p in sources):
+        raise ValueError(f"輸出目錄 {output_dir} 為專案根目錄或含有看板原始檔，請改用獨立目錄 (預設: {OUTPUT_DIR})")
+
+
+def build_site(output_dir=OUTPUT_DIR, force=False):
+    print("--- 開始建置靜態站台 ---")
+    check_output_dir(output_dir)
+    STYLES.update(load_styles())
+    raw_cases = load_js_array(CASES_JS)
+    raw_meetings = load_json(MEETINGS_JSON)
+    print(f"[*] 載入 {len(raw_cases)} 筆案件、{len(raw_meetings)} 場會議")
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = load_manifest(manifest_path)
+    fingerprint = build_fingerprint()
+    current = {}
+    built = skipped = 0
+
+    for rel_path, render, vm in plan_pages(raw_cases, raw_meetings):
+        digest = content_hash(fingerprint, vm)
+        current[rel_path] = digest
+        target = os.path.join(output_dir, rel_path)
+        if not force and previous.get(rel_path) == digest and os.path.exists(target):
+            skipped += 1
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(render(vm))
+        built += 1
+
+    # 移除來源資料已不存在的頁面；manifest 遺失或損毀時仍可依產生標記辨識
+    os.makedirs(output_dir, exist_ok=True)
+    removed = remove_stale_pages(output_dir, current, previous)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint, 'pages': current}, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ 完成！重建 {built} 頁、未變更略過 {skipped} 頁、移除 {removed} 頁 -> {output_dir}/")
+    return {'built': built, 'skipped': skipped, 'removed': removed}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="將爬取資料預先渲染為靜態 HTML 頁面")
+    parser.add_argument('--out', default=OUTPUT_DIR, help="輸出目錄 (預設: site)")
+    parser.add_argument('--force', action='store_true', help="忽略內容雜湊，重建所有頁面")
+    args = parser.parse_args()
+    build_site(args.out, args.force)
\ No newline at end of file